@@ -18,6 +18,9 @@ class ManualStepper:
             self.can_home = False
             self.rail = stepper.PrinterStepper(config)
             self.steppers = [self.rail]
+        stepper_enable = self.printer.lookup_object('stepper_enable')
+        self.enables = [stepper_enable.lookup_enable(s.get_name())
+                        for s in self.steppers]
         self.velocity = config.getfloat('velocity', 5., above=0.)
         self.accel = self.homing_accel = config.getfloat('accel', 0., minval=0.)
         self.next_cmd_time = 0.
@@ -42,15 +45,15 @@ class ManualStepper:
         else:
             self.next_cmd_time = print_time
     def do_enable(self, enable):
+        if all([se.is_motor_enabled() == bool(enable) for se in self.enables]):
+            # Already in requested state - no need to sync toolhead
+            return
         self.sync_print_time()
-        stepper_enable = self.printer.lookup_object('stepper_enable')
         if enable:
-            for s in self.steppers:
-                se = stepper_enable.lookup_enable(s.get_name())
+            for se in self.enables:
                 se.motor_enable(self.next_cmd_time)
         else:
-            for s in self.steppers:
-                se = stepper_enable.lookup_enable(s.get_name())
+            for se in self.enables:
                 se.motor_disable(self.next_cmd_time)
         self.sync_print_time()
     def do_set_position(self, setpos):
@@ -97,8 +100,9 @@ class ManualStepper:
             movepos = gcmd.get_float('MOVE')
             self.do_homing_move(movepos, speed, accel,
                                 homing_move > 0, abs(homing_move) == 1)
-        elif gcmd.get_float('MOVE', None) is not None:
-            movepos = gcmd.get_float('MOVE')
+            return
+        movepos = gcmd.get_float('MOVE', None)
+        if movepos is not None:
             sync = gcmd.get_int('SYNC', 1)
             self.do_move(movepos, speed, accel, sync)
         elif gcmd.get_int('SYNC', 0):
@@ -19,6 +19,7 @@ class CoreXZKinematics:
         self.rails[0].setup_itersolve('corexz_stepper_alloc', b'+')
         self.rails[1].setup_itersolve('cartesian_stepper_alloc', b'y')
         self.rails[2].setup_itersolve('corexz_stepper_alloc', b'-')
+        self.rail_names = [rail.get_name() for rail in self.rails]
         for s in self.get_steppers():
             s.set_trapq(toolhead.get_trapq())
             toolhead.register_step_generator(s.generate_steps)
@@ -37,7 +38,7 @@ class CoreXZKinematics:
     def get_steppers(self):
         return [s for rail in self.rails for s in rail.get_steppers()]
     def calc_position(self, stepper_positions):
-        pos = [stepper_positions[rail.get_name()] for rail in self.rails]
+        pos = [stepper_positions[name] for name in self.rail_names]
         return [0.5 * (pos[0] + pos[2]), pos[1], 0.5 * (pos[0] - pos[2])]
     def set_position(self, newpos, homing_axes):
         for i, rail in enumerate(self.rails):
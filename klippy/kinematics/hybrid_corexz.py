@@ -44,6 +44,7 @@ class HybridCoreXZKinematics:
                 stepper_alloc_inactive=('cartesian_stepper_alloc', b'z'))
             self.dc_module = idex_modes.DualCarriages(self.printer,
                         dc_rail_0, dc_rail_1, axis=0)
+        self.rail_names = [rail.get_name() for rail in self.rails]
         for s in self.get_steppers():
             s.set_trapq(toolhead.get_trapq())
             toolhead.register_step_generator(s.generate_steps)
@@ -59,9 +60,9 @@ class HybridCoreXZKinematics:
     def get_steppers(self):
         return [s for rail in self.rails for s in rail.get_steppers()]
     def calc_position(self, stepper_positions):
-        pos = [stepper_positions[rail.get_name()] for rail in self.rails]
-        if (self.dc_module is not None and 'CARRIAGE_1' == \
-                    self.dc_module.get_status()['active_carriage']):
+        pos = [stepper_positions[name] for name in self.rail_names]
+        if (self.dc_module is not None
+                and self.dc_module.is_carriage_1_active()):
             return [pos[0] - pos[2], pos[1], pos[2]]
         else:
             return [pos[0] + pos[2], pos[1], pos[2]]
@@ -69,6 +70,7 @@ class HybridCoreXZKinematics:
         self.limits[i] = range
     def override_rail(self, i, rail):
         self.rails[i] = rail
+        self.rail_names[i] = rail.get_name()
     def set_position(self, newpos, homing_axes):
         for i, rail in enumerate(self.rails):
             rail.set_position(newpos)
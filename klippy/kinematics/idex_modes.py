@@ -33,6 +33,8 @@ class DualCarriages:
                 kin.override_rail(self.axis, dc_rail)
                 toolhead.set_position(newpos)
                 kin.update_limits(self.axis, dc_rail.get_range())
+    def is_carriage_1_active(self):
+        return not self.dc[0].is_active()
     def get_status(self, eventtime=None):
         dc0, dc1 = self.dc
         if (dc0.is_active() is True):
@@ -5,7 +5,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import math, optparse, datetime
-import matplotlib
+import numpy as np, matplotlib
 
 SEG_TIME = .000100
 INV_SEG_TIME = 1. / SEG_TIME
@@ -27,7 +27,8 @@ ACCEL = 3000. * EXTRUDE_R
 
 def gen_positions():
     out = []
-    start_d = start_t = t = 0.
+    start_d = start_t = 0.
+    start_index = 0
     for start_v, end_v, move_t in Moves:
         start_v *= EXTRUDE_R
         end_v *= EXTRUDE_R
@@ -39,13 +40,13 @@ def gen_positions():
         elif start_v > end_v:
             half_accel = -.5 * ACCEL
         end_t = start_t + move_t
-        while t <= end_t:
-            rel_t = t - start_t
-            out.append(start_d + (start_v + half_accel * rel_t) * rel_t)
-            t += SEG_TIME
+        end_index = int(end_t * INV_SEG_TIME) + 1
+        rel_t = np.arange(start_index, end_index) * SEG_TIME - start_t
+        out.append(start_d + (start_v + half_accel * rel_t) * rel_t)
+        start_index = end_index
         start_d += (start_v + half_accel * move_t) * move_t
         start_t = end_t
-    return out
+    return np.concatenate(out)
 
 
 ######################################################################
@@ -59,12 +60,18 @@ def time_to_index(t):
 
 def indexes(positions):
     drop = time_to_index(MARGIN_TIME)
-    return range(drop, len(positions)-drop)
+    return drop, len(positions)-drop
 
 def trim_lists(*lists):
     keep = len(lists[0]) - time_to_index(2. * MARGIN_TIME)
-    for l in lists:
-        del l[keep:]
+    return [l[:keep] for l in lists]
+
+# Apply a (symmetric) filter kernel and clear the margins
+def apply_kernel(positions, kernel):
+    out = np.convolve(positions, kernel, mode='same')
+    start, end = indexes(out)
+    out[:start] = out[end:] = 0.
+    return out
 
 
 ######################################################################
@@ -73,36 +80,38 @@ def trim_lists(*lists):
 
 # Generate estimated first order derivative
 def gen_deriv(data):
-    return [0.] + [(data[i+1] - data[i]) * INV_SEG_TIME
-                   for i in range(len(data)-1)]
+    return np.concatenate(([0.], np.diff(data) * INV_SEG_TIME))
 
 # Simple average between two points smooth_time away
 def calc_average(positions, smooth_time):
     offset = time_to_index(smooth_time * .5)
-    out = [0.] * len(positions)
-    for i in indexes(positions):
-        out[i] = .5 * (positions[i-offset] + positions[i+offset])
+    positions = np.asarray(positions)
+    start, end = indexes(positions)
+    out = np.zeros_like(positions)
+    out[start:end] = .5 * (positions[start-offset:end-offset]
+                           + positions[start+offset:end+offset])
     return out
 
 # Average (via integration) of smooth_time range
 def calc_smooth(positions, smooth_time):
     offset = time_to_index(smooth_time * .5)
     weight = 1. / (2*offset - 1)
-    out = [0.] * len(positions)
-    for i in indexes(positions):
-        out[i] = sum(positions[i-offset+1:i+offset]) * weight
+    # Window sums from the difference of a running total
+    totals = np.concatenate(([0.], np.cumsum(positions)))
+    start, end = indexes(positions)
+    out = np.zeros(len(positions))
+    out[start:end] = (totals[start+offset:end+offset]
+                      - totals[start-offset+1:end-offset+1]) * weight
     return out
 
 # Time weighted average (via integration) of smooth_time range
-def calc_weighted(positions, smooth_time):
+def weighted_kernel(smooth_time):
     offset = time_to_index(smooth_time * .5)
-    weight = 1. / offset**2
-    out = [0.] * len(positions)
-    for i in indexes(positions):
-        weighted_data = [positions[j] * (offset - abs(j-i))
-                         for j in range(i-offset, i+offset)]
-        out[i] = sum(weighted_data) * weight
-    return out
+    kernel = offset - np.abs(np.arange(1 - offset, offset, dtype=float))
+    return kernel / offset**2
+
+def calc_weighted(positions, smooth_time):
+    return apply_kernel(positions, weighted_kernel(smooth_time))
 
 
 ######################################################################
@@ -115,14 +124,19 @@ PRESSURE_ADVANCE = .045
 # Calculate raw pressure advance positions
 def calc_pa_raw(positions):
     pa = PRESSURE_ADVANCE * INV_SEG_TIME
-    out = [0.] * len(positions)
-    for i in indexes(positions):
-        out[i] = positions[i] + pa * (positions[i+1] - positions[i])
+    positions = np.asarray(positions)
+    start, end = indexes(positions)
+    out = np.zeros_like(positions)
+    out[start:end] = positions[start:end] + pa * (positions[start+1:end+1]
+                                                  - positions[start:end])
     return out
 
-# Pressure advance after smoothing
+# Pressure advance after smoothing (both filters applied in one pass)
 def calc_pa(positions):
-    return calc_weighted(calc_pa_raw(positions), SMOOTH_TIME)
+    pa = PRESSURE_ADVANCE * INV_SEG_TIME
+    pa_kernel = [pa, 1. - pa, 0.]
+    kernel = np.convolve(weighted_kernel(SMOOTH_TIME), pa_kernel)
+    return apply_kernel(positions, kernel)
 
 
 ######################################################################
@@ -141,10 +155,11 @@ def plot_motion():
     sm_positions = calc_pa(positions)
     sm_velocities = gen_deriv(sm_positions)
     # Build plot
-    times = [SEG_TIME * i for i in range(len(positions))]
-    trim_lists(times, velocities, accels,
-               pa_positions, pa_velocities,
-               sm_positions, sm_velocities)
+    times = np.arange(len(positions)) * SEG_TIME
+    (times, velocities, accels, pa_positions, pa_velocities,
+     sm_positions, sm_velocities) = trim_lists(
+         times, velocities, accels, pa_positions, pa_velocities,
+         sm_positions, sm_velocities)
     fig, ax1 = matplotlib.pyplot.subplots(nrows=1, sharex=True)
     ax1.set_title("Extruder Velocity")
     ax1.set_ylabel('Velocity (mm/s)')